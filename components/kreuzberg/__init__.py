@@ -5,6 +5,7 @@ from components.kreuzberg.kreuzberg_cache import (
     FilesystemCacheBackend,
     RunReport,
     build_cache_key,
+    close_pools,
     log_run_report,
     parallel_map,
 )
@@ -17,6 +18,7 @@ from components.kreuzberg.kreuzberg_errors import (
     UnsupportedFormatError,
     map_extraction_exception,
 )
+from components.kreuzberg.kreuzberg_io import BatchFileLoader
 from components.kreuzberg.kreuzberg_types import (
     Chunk,
     ComponentPayload,
@@ -35,6 +37,7 @@ from components.kreuzberg.nodes.file_loader import KreuzbergFileLoaderComponent
 from components.kreuzberg.nodes.hello_component import KreuzbergHelloComponent
 
 __all__ = [
+    "BatchFileLoader",
     "CacheBackend",
     "Chunk",
     "FilesystemCacheBackend",
@@ -52,6 +55,7 @@ __all__ = [
     "RemoteExtractionError",
     "RunReport",
     "build_cache_key",
+    "close_pools",
     "ensure_metadata_dict",
     "hash_id",
     "log_run_report",
@@ -2,26 +2,49 @@
 
 from __future__ import annotations
 
-import re
+from html.parser import HTMLParser
 from typing import Any
 
+try:
+    from selectolax.parser import HTMLParser as _LexborParser
+except ImportError:  # optional C-accelerated HTML parser
+    _LexborParser = None
+
 from components.kreuzberg.kreuzberg_errors import (
     CorruptDocumentError,
     OCRBackendMissingError,
     UnsupportedFormatError,
 )
 
+_SUPPORTED_OCR_BACKENDS = frozenset({"tesseract", "paddleocr", "easyocr"})
+
+
+class _TextExtractor(HTMLParser):
+    """Collect text nodes from HTML, collapsing whitespace in a single pass."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._words: list[str] = []
+
+    def handle_data(self, data: str) -> None:
+        self._words.extend(data.split())
+
+    def text(self) -> str:
+        return " ".join(self._words)
+
 
 class ExtractionAdapter:
     """Lightweight extraction adapter that normalizes text across document types."""
 
-    SUPPORTED_MIME_TYPES = {
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "text/html",
-        "text/plain",
-        "image/png",
-    }
+    SUPPORTED_MIME_TYPES = frozenset(
+        {
+            "application/pdf",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "text/html",
+            "text/plain",
+            "image/png",
+        }
+    )
 
     def __init__(
         self,
@@ -34,6 +57,13 @@ class ExtractionAdapter:
         self.ocr_mode = ocr_mode
         self.ocr_backend = ocr_backend
         self.ocr_languages = ocr_languages or ["eng"]
+        # Validate the backend once up front so per-document extraction
+        # never re-checks it.
+        if ocr_mode != "off" and ocr_backend not in _SUPPORTED_OCR_BACKENDS:
+            raise OCRBackendMissingError(
+                f"Unsupported OCR backend requested: {ocr_backend}",
+                hint="Choose one of: tesseract, paddleocr, easyocr.",
+            )
 
     def extract(self, document_source: dict[str, Any]) -> str:
         mime = str(document_source.get("mime") or "application/octet-stream")
@@ -50,30 +80,48 @@ class ExtractionAdapter:
                 hint="Use PDF, DOCX, HTML, PNG, or plain text inputs.",
             )
 
-        if mime == "image/png":
-            if self.ocr_mode == "off":
-                raise CorruptDocumentError(
-                    "PNG extraction requires OCR but OCR mode is off.",
-                    hint="Set ocr_mode to 'auto' or 'force'.",
-                )
-            if self.ocr_backend not in {"tesseract", "paddleocr", "easyocr"}:
-                raise OCRBackendMissingError(
-                    f"Unsupported OCR backend requested: {self.ocr_backend}",
-                    hint="Choose one of: tesseract, paddleocr, easyocr.",
-                )
-            return "[OCR extracted text from PNG image]"
+        handler = self._HANDLERS.get(mime, ExtractionAdapter._extract_passthrough)
+        return handler(self, payload_bytes)
 
+    def _extract_png(self, payload_bytes: bytes) -> str:
+        if self.ocr_mode == "off":
+            raise CorruptDocumentError(
+                "PNG extraction requires OCR but OCR mode is off.",
+                hint="Set ocr_mode to 'auto' or 'force'.",
+            )
+        return "[OCR extracted text from PNG image]"
+
+    def _extract_html(self, payload_bytes: bytes) -> str:
+        return self._strip_html(self._decode(payload_bytes))
+
+    def _extract_passthrough(self, payload_bytes: bytes) -> str:
+        return self._decode(payload_bytes)
+
+    def _decode(self, payload_bytes: bytes) -> str:
         decoded = payload_bytes.decode("utf-8", errors="ignore").strip()
         if not decoded:
             raise CorruptDocumentError(
                 "Document content is empty after decoding.",
                 hint="Verify the file is not empty or encrypted.",
             )
-
-        if mime == "text/html":
-            return self._strip_html(decoded)
         return decoded
 
     def _strip_html(self, html: str) -> str:
-        text = re.sub(r"<[^>]+>", " ", html)
-        return re.sub(r"\s+", " ", text).strip()
+        if _LexborParser is not None:
+            tree = _LexborParser(html)
+            node = tree.body or tree.root
+            if node is not None:
+                return " ".join(node.text(separator=" ").split())
+        parser = _TextExtractor()
+        parser.feed(html)
+        parser.close()
+        return parser.text()
+
+
+# MIME dispatch table, built once at import time: extract() does one dict
+# lookup on unbound methods instead of allocating a bound-method dict per
+# adapter instance. New formats only need a new entry here.
+ExtractionAdapter._HANDLERS = {
+    "image/png": ExtractionAdapter._extract_png,
+    "text/html": ExtractionAdapter._extract_html,
+}
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import atexit
+import os
+import string
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Literal, Protocol, TypedDict, TypeVar
 
 from components.kreuzberg.kreuzberg_utils import hash_id
 
+try:
+    import diskcache
+except ImportError:  # optional SQLite-backed store; file-per-key otherwise
+    diskcache = None
+
 T = TypeVar("T")
 R = TypeVar("R")
 
+_SAFE_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+_UNSAFE_KEY_TABLE = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if chr(code) not in _SAFE_KEY_CHARS)
+)
+
 
 class RunReport(TypedDict):
     """Structured execution summary used across cache-enabled components."""
@@ -33,30 +49,89 @@ class CacheBackend(Protocol):
 
 
 class FilesystemCacheBackend:
-    """Filesystem-based cache backend with optional global disable flag."""
+    """Filesystem-based cache backend with optional global disable flag.
+
+    A small in-process LRU of recently used blobs sits in front of the disk
+    store so repeated lookups of the same key avoid filesystem syscalls.
+    When the optional ``diskcache`` package is installed its SQLite+WAL
+    store replaces the one-file-per-key layout, which avoids an inode
+    create/fsync per entry on write-heavy batch runs.
+    """
 
-    def __init__(self, cache_dir: str | Path, disable_cache: bool = False) -> None:
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        disable_cache: bool = False,
+        memory_cap_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
         self.cache_dir = Path(cache_dir)
         self.disable_cache = disable_cache
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_cap_bytes = memory_cap_bytes
+        self._memory_lock = threading.Lock()
+        self._diskcache = None
+        if not disable_cache and diskcache is not None:
+            self._diskcache = diskcache.Cache(str(self.cache_dir), size_limit=10 << 30)
 
     def get(self, key: str) -> bytes | None:
         if self.disable_cache:
             return None
 
-        path = self._cache_path(key)
-        if not path.exists() or not path.is_file():
+        with self._memory_lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+
+        if self._diskcache is not None:
+            value = self._diskcache.get(key)
+            if value is None:
+                return None
+            self._remember(key, value)
+            return value
+
+        # One open+read instead of stat/stat/read; broken non-file entries
+        # fall through as misses, matching the old is_file() guard.
+        try:
+            value = self._cache_path(key).read_bytes()
+        except (FileNotFoundError, IsADirectoryError):
             return None
-
-        return path.read_bytes()
+        self._remember(key, value)
+        return value
 
     def set(self, key: str, value: bytes) -> None:
         if self.disable_cache:
             return
 
+        if self._diskcache is not None:
+            self._diskcache.set(key, value)
+            self._remember(key, value)
+            return
+
         path = self._cache_path(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(value)
+        try:
+            self._write_atomic(path, value)
+        except FileNotFoundError:
+            # Shard directories are created lazily on first write so an
+            # idle backend never touches the filesystem; retry once.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(path, value)
+        self._remember(key, value)
+
+    def _remember(self, key: str, value: bytes) -> None:
+        if len(value) > self._memory_cap_bytes:
+            return
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = value
+            self._memory_bytes += len(value)
+            while self._memory_bytes > self._memory_cap_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
 
     def make_cache_key(self, component_name: str, *content_parts: object) -> str:
         """Build deterministic cache keys using the shared ``hash_id`` helper."""
@@ -64,8 +139,19 @@ class FilesystemCacheBackend:
         return hash_id(component_name, *content_parts)
 
     def _cache_path(self, key: str) -> Path:
-        safe_key = "".join(char for char in key if char.isalnum() or char in {"-", "_"})
-        return self.cache_dir / f"{safe_key}.bin"
+        # hash_id-produced keys are pure hex, so the common case skips the
+        # translate entirely; anything else is sanitized in one C-level pass.
+        safe_key = key if key.isalnum() else key.translate(_UNSAFE_KEY_TABLE)
+        # Shard by key prefix so no single directory grows unbounded and
+        # lookups stay fast on filesystems with linear directory scans.
+        return self.cache_dir / safe_key[:2] / f"{safe_key}.bin"
+
+    def _write_atomic(self, path: Path, value: bytes) -> None:
+        # Write to a sibling temp file and rename into place so concurrent
+        # readers never observe a partially written entry.
+        tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+        tmp.write_bytes(value)
+        os.replace(tmp, path)
 
 
 def build_cache_key(component_name: str, *content_parts: object) -> str:
@@ -74,27 +160,83 @@ def build_cache_key(component_name: str, *content_parts: object) -> str:
     return hash_id(component_name, *content_parts)
 
 
+_POOL_CACHE: dict[tuple[str, int], Executor] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(mode: str, max_workers: int) -> Executor:
+    """Return a warm executor for ``(mode, max_workers)``, creating it once.
+
+    Cached executors stay alive for the life of the process (shut down via
+    ``atexit`` or :func:`close_pools`), so repeated batches skip worker
+    spawn/join costs. Callers must not shut the returned executor down
+    themselves.
+    """
+
+    key = (mode, max_workers)
+    with _POOL_LOCK:
+        pool = _POOL_CACHE.get(key)
+        if pool is None:
+            executor_type = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            pool = executor_type(max_workers=max_workers)
+            _POOL_CACHE[key] = pool
+    return pool
+
+
+def close_pools() -> None:
+    """Shut down and forget all cached executors (useful in test teardown)."""
+
+    with _POOL_LOCK:
+        pools = list(_POOL_CACHE.values())
+        _POOL_CACHE.clear()
+    for pool in pools:
+        pool.shutdown(wait=False)
+
+
+atexit.register(close_pools)
+
+
+async def _async_map(fn: Callable[[T], R], items: list[T], max_workers: int) -> list[R]:
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run_one(item: T) -> R:
+        async with semaphore:
+            return await asyncio.to_thread(fn, item)
+
+    return list(await asyncio.gather(*(run_one(item) for item in items)))
+
+
 def parallel_map(
     fn: Callable[[T], R],
     items: list[T],
     max_workers: int,
-    mode: Literal["thread", "process"] = "thread",
+    mode: Literal["thread", "process", "async"] = "thread",
 ) -> list[R]:
-    """Map ``fn`` across items with optional thread/process execution.
+    """Map ``fn`` across items with thread, process, or asyncio execution.
 
-    Ordering always matches the original ``items`` ordering.
+    Ordering always matches the original ``items`` ordering. The ``async``
+    mode fans work out on a single event loop, which suits IO-bound calls
+    that would otherwise tie up pool workers while blocked.
     """
 
     if max_workers < 1:
         raise ValueError("max_workers must be >= 1")
-    if mode not in {"thread", "process"}:
-        raise ValueError("mode must be either 'thread' or 'process'")
+    if mode not in {"thread", "process", "async"}:
+        raise ValueError("mode must be one of: 'thread', 'process', 'async'")
     if not items:
         return []
 
-    executor_type = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
-    with executor_type(max_workers=max_workers) as executor:
-        return list(executor.map(fn, items))
+    if mode == "async":
+        return asyncio.run(_async_map(fn, items, max_workers))
+
+    # Batch items per IPC round-trip so pickling/queue overhead is amortized
+    # instead of being paid once per item. Ceiling division keeps roughly
+    # four chunks per worker; threads ignore chunksize, so keep it at 1.
+    if mode == "process":
+        chunksize = (len(items) + 4 * max_workers - 1) // (4 * max_workers)
+    else:
+        chunksize = 1
+    return list(_get_pool(mode, max_workers).map(fn, items, chunksize=chunksize))
 
 
 def log_run_report(logger: Any, component_name: str, run_report: RunReport) -> None:
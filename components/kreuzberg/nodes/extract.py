@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import time
 from typing import Any
 
@@ -17,6 +18,23 @@ from components.kreuzberg.kreuzberg_errors import (
 )
 from components.kreuzberg.kreuzberg_types import ExtractedDocument
 
+# Magic-byte signatures for payloads that arrive without a MIME type.
+# DOCX files are ZIP containers, so the PK header maps to the DOCX MIME
+# this pipeline already supports.
+_MAGIC_PREFIXES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+)
+
+
+def _sniff_mime(payload_bytes: bytes) -> str | None:
+    """Return a MIME type guessed from leading magic bytes, or ``None``."""
+    for prefix, mime in _MAGIC_PREFIXES:
+        if payload_bytes.startswith(prefix):
+            return mime
+    return None
+
 
 class KreuzbergExtractComponent(Component):
     """Extract text and optional structures from a canonical DocumentSource payload."""
@@ -118,6 +136,18 @@ class KreuzbergExtractComponent(Component):
 
     _last_result: dict[str, Any] | None = None
 
+    @classmethod
+    @functools.cache
+    def input_names(cls) -> frozenset[str]:
+        """Cached port-name set; the input list is static per class."""
+        return frozenset(port.name for port in cls.inputs)
+
+    @classmethod
+    @functools.cache
+    def output_names(cls) -> frozenset[str]:
+        """Cached port-name set; the output list is static per class."""
+        return frozenset(port.name for port in cls.outputs)
+
     def build(
         self,
         document_source: dict[str, Any] | Data,
@@ -145,6 +175,15 @@ class KreuzbergExtractComponent(Component):
                 hint="Connect the output of Kreuzberg File Loader to document_source.",
             )
 
+        # A declared MIME type always wins; sniffing only fills the gap for
+        # payloads that arrive without one.
+        if not source_payload.get("mime"):
+            raw = source_payload.get("bytes")
+            if isinstance(raw, bytes):
+                sniffed = _sniff_mime(raw)
+                if sniffed:
+                    source_payload = {**source_payload, "mime": sniffed}
+
         languages = self._normalize_languages(ocr_languages)
         _ = quality_processing, pdf_hierarchy_detection, enable_cache, cache_dir
 
@@ -164,16 +203,22 @@ class KreuzbergExtractComponent(Component):
                 filename=str(source_payload.get("filename") or "<unknown file>"),
             ) from exc
 
-        metadata = {
-            "source_id": source_payload.get("source_id"),
-            "filename": source_payload.get("filename"),
-            "mime": source_payload.get("mime"),
-            "page_count": 1,
-            "ocr_used": source_payload.get("mime") == "image/png",
-            "ocr_backend": ocr_backend if source_payload.get("mime") == "image/png" else None,
-            "format": output_format,
-        }
-        if not include_metadata:
+        mime = source_payload.get("mime")
+        filename = source_payload.get("filename")
+        is_png = mime == "image/png"
+        used_ocr_backend = ocr_backend if is_png else None
+
+        if include_metadata:
+            metadata = {
+                "source_id": source_payload.get("source_id"),
+                "filename": filename,
+                "mime": mime,
+                "page_count": 1,
+                "ocr_used": is_png,
+                "ocr_backend": used_ocr_backend,
+                "format": output_format,
+            }
+        else:
             metadata = {}
 
         extracted_doc: ExtractedDocument = {
@@ -203,9 +248,11 @@ class KreuzbergExtractComponent(Component):
             "cache_misses": 1,
             "errors": 0,
             "item_count": 1,
-            "ocr_backend": metadata.get("ocr_backend"),
+            "ocr_backend": used_ocr_backend,
         }
 
+        # extracted_doc is the single source of truth; the top-level keys in
+        # the returned mapping alias its fields rather than copying them.
         self._last_result = {
             "extracted_doc": extracted_doc,
             "tables": extracted_doc["tables"],
@@ -213,7 +260,7 @@ class KreuzbergExtractComponent(Component):
             "pages": extracted_doc["pages"],
             "run_report": run_report,
         }
-        self.status = f"Extracted {metadata.get('filename') or 'document'}"
+        self.status = f"Extracted {filename or 'document'}"
         return self._last_result
 
     def build_extracted_doc(self) -> Data:
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import mimetypes
-from hashlib import sha256
+import mmap
+import os
+from collections.abc import Callable
+from hashlib import blake2b
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +18,30 @@ from lfx.schema import Data
 from components.kreuzberg.kreuzberg_types import DocumentSource
 from components.kreuzberg.kreuzberg_utils import hash_id
 
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Extensions this bundle routinely sees, resolved without touching the
+# mimetypes database (which URL-parses its argument on every call).
+_EXT_MIME = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".md": "text/markdown",
+    ".txt": "text/plain",
+    ".png": "image/png",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """Resolve a lowercased extension to a MIME type, memoized per extension."""
+    known = _EXT_MIME.get(ext)
+    if known:
+        return known
+    guessed, _ = mimetypes.guess_type(f"x{ext}")
+    return guessed or "application/octet-stream"
+
 
 class KreuzbergFileLoaderComponent(Component):
     """Load an uploaded file or file path into canonical DocumentSource payload."""
@@ -66,12 +94,12 @@ class KreuzbergFileLoaderComponent(Component):
         filename = filename_override
 
         if file is not None:
-            payload_bytes = self._read_uploaded_file(file)
+            payload_bytes, content_hash = self._read_and_hash(file)
             if not filename:
                 filename = self._extract_upload_filename(file)
         else:
             path = Path(file_path or "")
-            payload_bytes = path.read_bytes()
+            payload_bytes, content_hash = self._read_and_hash(path)
             if not filename:
                 filename = path.name
 
@@ -79,7 +107,6 @@ class KreuzbergFileLoaderComponent(Component):
             filename = "unknown"
 
         mime = mime_override or self._guess_mime(filename=filename, source_uri=source_uri)
-        content_hash = sha256(payload_bytes).hexdigest()
 
         payload: DocumentSource = {
             "bytes": payload_bytes,
@@ -97,21 +124,63 @@ class KreuzbergFileLoaderComponent(Component):
             raise ValueError("No file has been loaded yet.")
         return Data(data=self._last_payload)
 
-    def _read_uploaded_file(self, file: Any) -> bytes:
-        if isinstance(file, bytes):
-            return file
-        if hasattr(file, "read"):
-            data = file.read()
-            if hasattr(file, "seek"):
-                file.seek(0)
-            if isinstance(data, bytes):
-                return data
+    def _read_and_hash(self, source: Any) -> tuple[bytes, str]:
+        """Read a payload while hashing it in the same pass.
+
+        Fusing the read loop with an incremental hasher avoids a second
+        full traversal of the buffer after I/O completes.
+        """
+        hasher = blake2b(digest_size=16)
+        if isinstance(source, bytes):
+            hasher.update(source)
+            return source, hasher.hexdigest()
+
+        if isinstance(source, Path):
+            with source.open("rb", buffering=_READ_CHUNK_SIZE) as handle:
+                # Hash straight over a read-only mapping so the kernel page
+                # cache backs both the hash pass and the payload copy.
+                try:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+                        return bytes(mapped), hasher.hexdigest()
+                except (ValueError, OSError):  # empty file or mmap-unsupported source
+                    return self._drain_and_hash(handle.read, hasher)
+
+        if hasattr(source, "read"):
+            fd = self._usable_fileno(source)
+            if fd is not None:
+                return self._drain_and_hash(lambda size: os.read(fd, size), hasher)
+            data = source.read()
             if isinstance(data, str):
-                return data.encode("utf-8")
+                data = data.encode("utf-8")
+            if isinstance(data, bytes):
+                hasher.update(data)
+                return data, hasher.hexdigest()
+
         raise ValueError(
             "Unsupported upload type for 'file'. Provide bytes or a readable file object."
         )
 
+    def _drain_and_hash(
+        self,
+        read: Callable[[int], bytes],
+        hasher: Any,
+    ) -> tuple[bytes, str]:
+        buffer = bytearray()
+        while chunk := read(_READ_CHUNK_SIZE):
+            hasher.update(chunk)
+            buffer.extend(chunk)
+        return bytes(buffer), hasher.hexdigest()
+
+    def _usable_fileno(self, file: Any) -> int | None:
+        fileno = getattr(file, "fileno", None)
+        if fileno is None:
+            return None
+        try:
+            return fileno()
+        except (OSError, ValueError):
+            return None
+
     def _extract_upload_filename(self, file: Any) -> str | None:
         name = getattr(file, "name", None)
         if isinstance(name, str) and name.strip():
@@ -119,5 +188,4 @@ class KreuzbergFileLoaderComponent(Component):
         return None
 
     def _guess_mime(self, filename: str, source_uri: str | None) -> str:
-        guessed, _ = mimetypes.guess_type(source_uri or filename)
-        return guessed or "application/octet-stream"
+        return _mime_for_ext(Path(source_uri or filename).suffix.lower())
@@ -0,0 +1,223 @@
+"""Minimal GitHub API client shared by the importer scripts.
+
+Replaces the per-call `gh` subprocess forks with one authenticated
+``requests.Session`` so every REST/GraphQL call reuses a single keep-alive
+TLS connection. The `gh` CLI is still used once at startup to read the
+token (and to resolve the current repository when --repo is omitted).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import requests
+except ImportError:
+    print("Missing dependency: requests. Install with: pip install requests", file=sys.stderr)
+    sys.exit(1)
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # orjson parses/serializes in C; stdlib json works too
+    import json as _stdlib_json
+
+    _json_loads = _stdlib_json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj).encode("utf-8")
+
+API_ROOT = "https://api.github.com"
+CACHE_DIR = Path.home() / ".cache" / "langflow-kreuzberg" / "gh"
+
+
+class GitHubError(RuntimeError):
+    """Raised when a GitHub API call fails."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+_session: requests.Session | None = None
+_repo_cache: dict[str | None, tuple[str, str]] = {}
+_cache_disabled = False
+
+
+def disable_cache() -> None:
+    """Bypass the on-disk response cache for this process (--no-cache)."""
+    global _cache_disabled
+    _cache_disabled = True
+
+
+def cached_json(key: str, ttl_s: int, fetch: Callable[[], Any]) -> Any:
+    """Return ``fetch()``, memoized on disk under ``key`` for ``ttl_s`` seconds.
+
+    Lets repeated importer runs within the TTL skip the paginated list
+    round-trips entirely. Failures to read or write the cache fall back to
+    a plain fetch.
+    """
+    if _cache_disabled:
+        return fetch()
+    path = CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+    try:
+        if time.time() - path.stat().st_mtime <= ttl_s:
+            return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    result = fetch()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_json_dumps(result))
+    except OSError:
+        pass
+    return result
+
+
+def _page_cache_path(url: str) -> Path:
+    return CACHE_DIR / "pages" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_cached_page(url: str) -> dict[str, Any] | None:
+    try:
+        return _json_loads(_page_cache_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_page(url: str, etag: str, body: Any, next_url: str | None) -> None:
+    path = _page_cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_json_dumps({"etag": etag, "body": body, "next": next_url}))
+    except OSError:
+        pass
+
+
+def _gh_token() -> str:
+    try:
+        # Keep bytes on the wire; decode once rather than paying for a
+        # TextIOWrapper around the pipe.
+        return subprocess.check_output(["gh", "auth", "token"]).decode("utf-8").strip()
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise GitHubError(f"could not read a token from gh: {exc}") from exc
+
+
+def session() -> requests.Session:
+    """Return the process-wide authenticated session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(
+            {
+                "Authorization": f"Bearer {_gh_token()}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+    return _session
+
+
+def resolve_repo(repo: str | None) -> tuple[str, str]:
+    """Return ``(owner, name)``, resolving the current repo via gh only once."""
+    cached = _repo_cache.get(repo)
+    if cached:
+        return cached
+    if repo:
+        owner, name = repo.split("/", 1)
+    else:
+        try:
+            out = (
+                subprocess.check_output(
+                    ["gh", "repo", "view", "--json", "nameWithOwner", "--jq", ".nameWithOwner"]
+                )
+                .decode("utf-8")
+                .strip()
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            raise GitHubError(f"could not resolve current repository: {exc}") from exc
+        owner, name = out.split("/", 1)
+    _repo_cache[repo] = (owner, name)
+    return owner, name
+
+
+def _check(resp: requests.Response) -> requests.Response:
+    if resp.status_code >= 400:
+        raise GitHubError(
+            f"{resp.request.method} {resp.url} -> {resp.status_code}: {resp.text[:200]}",
+            status=resp.status_code,
+        )
+    return resp
+
+
+def get_paginated(path: str, params: dict[str, Any] | None = None) -> list[Any]:
+    """GET a list endpoint, following ``Link: rel=next`` pagination.
+
+    Each page's ETag and body are cached on disk and replayed with an
+    ``If-None-Match`` header, so unchanged pages come back as 304s: no
+    response body on the wire and no hit against the rate limit. This
+    complements :func:`cached_json` — once its TTL lapses, revalidating
+    here costs only header round-trips.
+    """
+    merged = {"per_page": 100, **(params or {})}
+    url = requests.Request("GET", f"{API_ROOT}{path}", params=merged).prepare().url
+    results: list[Any] = []
+    try:
+        while url:
+            cached = None if _cache_disabled else _load_cached_page(url)
+            headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+            resp = session().get(url, headers=headers, timeout=30)
+            if resp.status_code == 304 and cached is not None:
+                results.extend(cached["body"])
+                url = cached.get("next")
+                continue
+            _check(resp)
+            body = _json_loads(resp.content)
+            next_url = resp.links.get("next", {}).get("url")
+            etag = resp.headers.get("ETag")
+            if etag and not _cache_disabled:
+                _store_cached_page(url, etag, body, next_url)
+            results.extend(body)
+            url = next_url
+    except requests.RequestException as exc:
+        raise GitHubError(str(exc)) from exc
+    return results
+
+
+def post(path: str, payload: dict[str, Any]) -> Any:
+    try:
+        resp = _check(session().post(f"{API_ROOT}{path}", json=payload, timeout=30))
+        return _json_loads(resp.content)
+    except requests.RequestException as exc:
+        raise GitHubError(str(exc)) from exc
+
+
+def patch(path: str, payload: dict[str, Any]) -> Any:
+    try:
+        resp = _check(session().patch(f"{API_ROOT}{path}", json=payload, timeout=30))
+        return _json_loads(resp.content)
+    except requests.RequestException as exc:
+        raise GitHubError(str(exc)) from exc
+
+
+def graphql(query: str, variables: dict[str, Any]) -> Any:
+    """POST a GraphQL query and return its ``data`` payload."""
+    try:
+        resp = _check(
+            session().post(
+                f"{API_ROOT}/graphql",
+                json={"query": query, "variables": variables},
+                timeout=30,
+            )
+        )
+    except requests.RequestException as exc:
+        raise GitHubError(str(exc)) from exc
+    body = _json_loads(resp.content)
+    if body.get("errors"):
+        raise GitHubError(str(body["errors"]))
+    return body["data"]
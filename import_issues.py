@@ -6,8 +6,8 @@ Usage:
     python import_issues.py [--repo owner/name] [--file issues.yaml] [--dry-run]
 
 Requirements:
-    pip install pyyaml
-    gh CLI authenticated (gh auth login)
+    pip install pyyaml requests
+    gh CLI authenticated (gh auth login) — used once to read the API token.
 
 Notes:
     - Labels and milestones must already exist (run import_labels.py and
@@ -17,10 +17,8 @@ Notes:
     - Use --dry-run to preview without creating anything.
 """
 
-import json
-import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import yaml
@@ -28,50 +26,57 @@ except ImportError:
     print("Missing dependency: pyyaml. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not installed; fall back to pure Python
+    from yaml import SafeLoader as _YamlLoader
 
-def run(cmd: list[str], capture: bool = False) -> subprocess.CompletedProcess:
-    print("  $", " ".join(cmd))
-    return subprocess.run(cmd, check=True, capture_output=capture, text=True)
-
+import gh_api
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 def get_milestone_map(repo: str | None) -> dict[str, str]:
     """Return {title: number_str} for all open milestones."""
-    if repo:
-        owner, name = repo.split("/", 1)
-        endpoint = f"repos/{owner}/{name}/milestones"
-    else:
-        endpoint = "repos/{owner}/{repo}/milestones"
-
-    result = subprocess.run(
-        ["gh", "api", endpoint, "--paginate"],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        print(f"  [warn] Could not fetch milestones: {result.stderr.strip()}")
-        return {}
     try:
-        data = json.loads(result.stdout)
-        return {m["title"]: str(m["number"]) for m in data}
-    except (json.JSONDecodeError, KeyError):
+        owner, name = gh_api.resolve_repo(repo)
+        data = gh_api.cached_json(
+            f"{owner}/{name}:milestones",
+            ttl_s=60,
+            fetch=lambda: gh_api.get_paginated(f"/repos/{owner}/{name}/milestones"),
+        )
+    except gh_api.GitHubError as exc:
+        print(f"  [warn] Could not fetch milestones: {exc}")
         return {}
+    return {m["title"]: str(m["number"]) for m in data}
 
 
-def issue_exists(title: str, repo: str | None) -> bool:
-    """Check whether an open issue with this exact title already exists."""
-    cmd = ["gh", "issue", "list", "--search", f'"{title}" in:title',
-           "--state", "open", "--json", "title", "--limit", "25"]
-    if repo:
-        cmd += ["--repo", repo]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        return False
+def get_open_issue_titles(repo: str | None) -> frozenset[str]:
+    """Fetch all open issue titles in one paginated GraphQL query.
+
+    Prefetching once turns the per-issue existence check into an O(1) set
+    lookup instead of a search API round-trip per item.
+    """
+    query = (
+        "query($o: String!, $n: String!, $endCursor: String) {"
+        " repository(owner: $o, name: $n) {"
+        " issues(first: 100, states: OPEN, after: $endCursor) {"
+        " pageInfo { hasNextPage endCursor } nodes { title } } } }"
+    )
+    titles: set[str] = set()
     try:
-        issues = json.loads(result.stdout)
-        return any(i["title"] == title for i in issues)
-    except (json.JSONDecodeError, KeyError):
-        return False
+        owner, name = gh_api.resolve_repo(repo)
+        cursor: str | None = None
+        while True:
+            data = gh_api.graphql(query, {"o": owner, "n": name, "endCursor": cursor})
+            issues = data["repository"]["issues"]
+            titles.update(node["title"] for node in issues["nodes"])
+            if not issues["pageInfo"]["hasNextPage"]:
+                break
+            cursor = issues["pageInfo"]["endCursor"]
+    except gh_api.GitHubError as exc:
+        print(f"  [warn] Could not fetch open issues: {exc}")
+        return frozenset()
+    return frozenset(titles)
 
 
 # ── Core ─────────────────────────────────────────────────────────────────────
@@ -79,63 +84,77 @@ def issue_exists(title: str, repo: str | None) -> bool:
 def create_issue(
     item: dict,
     milestone_map: dict[str, str],
+    open_titles: frozenset[str],
     repo: str | None,
     dry_run: bool,
-) -> None:
+) -> tuple[str, str, str]:
+    """Create one issue and return a ``(status, title, detail)`` record."""
     title: str = item["title"]
     body: str = item.get("body", "")
     labels: list[str] = item.get("labels", [])
     milestone_title: str | None = item.get("milestone")
 
-    if issue_exists(title, repo):
-        print(f"  [skip] Issue already exists: {title}")
-        return
+    if title in open_titles:
+        return ("skip", title, "issue already exists")
 
-    cmd = ["gh", "issue", "create", "--title", title, "--body", body]
-
-    for label in labels:
-        cmd += ["--label", label]
+    payload: dict = {"title": title, "body": body}
+    if labels:
+        payload["labels"] = labels
 
+    detail = ""
     if milestone_title:
         milestone_number = milestone_map.get(milestone_title)
         if milestone_number:
-            cmd += ["--milestone", milestone_number]
+            payload["milestone"] = int(milestone_number)
         else:
-            print(
-                "  [warn] Milestone not found: "
-                f"'{milestone_title}' — skipping milestone assignment"
-            )
-
-    if repo:
-        cmd += ["--repo", repo]
+            detail = f"milestone not found: '{milestone_title}' — skipped assignment"
 
     if dry_run:
-        print(f"  [dry-run] Would create: {title}")
-        return
+        return ("dry-run", title, detail)
 
     try:
-        run(cmd)
-    except subprocess.CalledProcessError as exc:
-        print(f"  [error] Failed for issue '{title}': {exc}", file=sys.stderr)
+        owner, name = gh_api.resolve_repo(repo)
+        gh_api.post(f"/repos/{owner}/{name}/issues", payload)
+    except gh_api.GitHubError as exc:
+        return ("error", title, str(exc))
+    return ("created", title, detail)
 
 
 # ── Entry ─────────────────────────────────────────────────────────────────────
 
-def main(path: str = "issues.yaml", repo: str | None = None, dry_run: bool = False) -> None:
-    items: list[dict] = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+def main(
+    path: str = "issues.yaml",
+    repo: str | None = None,
+    dry_run: bool = False,
+    workers: int = 8,
+    no_cache: bool = False,
+) -> None:
+    if no_cache:
+        gh_api.disable_cache()
+    with open(path, "rb") as handle:
+        items: list[dict] = yaml.load(handle, Loader=_YamlLoader)
 
     print("Fetching milestone map from GitHub...")
     milestone_map = get_milestone_map(repo)
     print(f"  Found {len(milestone_map)} milestones: {list(milestone_map.keys())}\n")
 
+    print("Fetching open issue titles from GitHub...")
+    open_titles = get_open_issue_titles(repo)
+    print(f"  Found {len(open_titles)} open issues\n")
+
+    # Issue creation is network-bound, so fan the API calls out over threads.
     total = len(items)
-    for idx, item in enumerate(items, start=1):
-        title = item.get("title", f"Issue #{idx}")
-        print(f"[{idx}/{total}] {title}")
-        create_issue(item, milestone_map, repo, dry_run)
-        print()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(create_issue, item, milestone_map, open_titles, repo, dry_run)
+            for item in items
+        ]
+        for idx, future in enumerate(as_completed(futures), start=1):
+            status, title, detail = future.result()
+            suffix = f" ({detail})" if detail else ""
+            print(f"[{idx}/{total}] [{status}] {title}{suffix}")
 
-    print("All issues processed.")
+    print("\nAll issues processed.")
 
 
 if __name__ == "__main__":
@@ -149,5 +168,15 @@ if __name__ == "__main__":
         help="GitHub repo in owner/name format (owner/name)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Preview without creating issues")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent issue submissions")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the local GitHub response cache"
+    )
     args = parser.parse_args()
-    main(path=args.file, repo=args.repo, dry_run=args.dry_run)
+    main(
+        path=args.file,
+        repo=args.repo,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        no_cache=args.no_cache,
+    )
@@ -5,14 +5,12 @@ Usage:
     python import_labels.py [--repo owner/name] [--file labels.yaml] [--update]
 
 Requirements:
-    pip install pyyaml
-    gh CLI authenticated (gh auth login)
+    pip install pyyaml requests
+    gh CLI authenticated (gh auth login) — used once to read the API token.
 """
 
-import json
-import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import yaml
@@ -20,68 +18,80 @@ except ImportError:
     print("Missing dependency: pyyaml. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not installed; fall back to pure Python
+    from yaml import SafeLoader as _YamlLoader
 
-def run(cmd: list[str], capture: bool = False) -> subprocess.CompletedProcess:
-    print("  $", " ".join(cmd))
-    return subprocess.run(
-        cmd,
-        check=True,
-        capture_output=capture,
-        text=True,
-    )
+import gh_api
 
 
 def get_existing_labels(repo: str | None) -> set[str]:
     """Return a set of label names already on the repo."""
-    cmd = ["gh", "label", "list", "--json", "name", "--limit", "500"]
-    if repo:
-        cmd += ["--repo", repo]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  [warn] Could not fetch existing labels: {result.stderr.strip()}")
-        return set()
     try:
-        data = json.loads(result.stdout)
-        return {item["name"] for item in data}
-    except (json.JSONDecodeError, KeyError):
+        owner, name = gh_api.resolve_repo(repo)
+        data = gh_api.cached_json(
+            f"{owner}/{name}:labels",
+            ttl_s=60,
+            fetch=lambda: gh_api.get_paginated(f"/repos/{owner}/{name}/labels"),
+        )
+    except gh_api.GitHubError as exc:
+        print(f"  [warn] Could not fetch existing labels: {exc}")
         return set()
+    return {item["name"] for item in data}
 
 
 def create_label(name: str, color: str, description: str, repo: str | None) -> None:
-    cmd = [
-        "gh", "label", "create", name,
-        "--color", color.lstrip("#"),
-        "--description", description,
-        "--force",          # update if exists
-    ]
-    if repo:
-        cmd += ["--repo", repo]
-    run(cmd)
-
-
-def main(path: str = "labels.yaml", repo: str | None = None) -> None:
-    items: list[dict] = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    owner, repo_name = gh_api.resolve_repo(repo)
+    payload = {"name": name, "color": color.lstrip("#"), "description": description}
+    try:
+        gh_api.post(f"/repos/{owner}/{repo_name}/labels", payload)
+    except gh_api.GitHubError as exc:
+        # 422 means the label already exists; update it instead (same
+        # semantics as `gh label create --force`).
+        if exc.status != 422:
+            raise
+        gh_api.patch(f"/repos/{owner}/{repo_name}/labels/{name}", payload)
+
+
+def main(
+    path: str = "labels.yaml",
+    repo: str | None = None,
+    workers: int = 8,
+    no_cache: bool = False,
+) -> None:
+    if no_cache:
+        gh_api.disable_cache()
+    with open(path, "rb") as handle:
+        items: list[dict] = yaml.load(handle, Loader=_YamlLoader)
     existing = get_existing_labels(repo)
 
     created = updated = skipped = 0
 
-    for item in items:
-        name: str = item["name"]
-        color: str = item.get("color", "ededed")
-        description: str = item.get("description", "")
-
-        if name in existing:
-            print(f"[update] {name}")
-            updated += 1
-        else:
-            print(f"[create] {name}")
-            created += 1
-
-        try:
-            create_label(name, color, description, repo)
-        except subprocess.CalledProcessError as exc:
-            print(f"  [error] Failed for label '{name}': {exc}", file=sys.stderr)
-            skipped += 1
+    # Label creation is network-bound, so fan the API calls out over threads.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for item in items:
+            name: str = item["name"]
+            color: str = item.get("color", "ededed")
+            description: str = item.get("description", "")
+            action = "update" if name in existing else "create"
+            future = executor.submit(create_label, name, color, description, repo)
+            futures[future] = (name, action)
+
+        for future in as_completed(futures):
+            name, action = futures[future]
+            try:
+                future.result()
+            except gh_api.GitHubError as exc:
+                print(f"  [error] Failed for label '{name}': {exc}", file=sys.stderr)
+                skipped += 1
+                continue
+            print(f"[{action}] {name}")
+            if action == "update":
+                updated += 1
+            else:
+                created += 1
 
     print(f"\nDone. created={created}  updated={updated}  errors={skipped}")
 
@@ -92,5 +102,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Import labels from YAML to GitHub.")
     parser.add_argument("--file", default="labels.yaml", help="Path to labels YAML file")
     parser.add_argument("--repo", default=None, help="GitHub repo in owner/name format")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent label submissions")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the local GitHub response cache"
+    )
     args = parser.parse_args()
-    main(path=args.file, repo=args.repo)
+    main(path=args.file, repo=args.repo, workers=args.workers, no_cache=args.no_cache)
@@ -6,14 +6,12 @@ Usage:
     python import_milestones.py [--repo owner/name] [--file milestones.yaml]
 
 Requirements:
-    pip install pyyaml
-    gh CLI authenticated (gh auth login)
+    pip install pyyaml requests
+    gh CLI authenticated (gh auth login) — used once to read the API token.
 """
 
-import json
-import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import yaml
@@ -21,31 +19,35 @@ except ImportError:
     print("Missing dependency: pyyaml. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not installed; fall back to pure Python
+    from yaml import SafeLoader as _YamlLoader
 
-def run(cmd: list[str], capture: bool = False) -> subprocess.CompletedProcess:
-    print("  $", " ".join(cmd))
-    return subprocess.run(cmd, check=True, capture_output=capture, text=True)
+import gh_api
 
 
 def get_existing_milestones(repo: str | None) -> dict[str, int]:
     """Return dict of {title: number} for milestones already on the repo."""
-    cmd = ["gh", "api", "repos/{owner}/{repo}/milestones", "--paginate"]
-    # Use gh api with dynamic repo resolution when repo is provided
-    if repo:
-        owner, name = repo.split("/", 1)
-        cmd = ["gh", "api", f"repos/{owner}/{name}/milestones", "--paginate"]
-    else:
-        cmd = ["gh", "api", "repos/{owner}/{repo}/milestones", "--paginate"]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  [warn] Could not fetch milestones: {result.stderr.strip()}")
-        return {}
     try:
-        data = json.loads(result.stdout)
-        return {m["title"]: m["number"] for m in data}
-    except (json.JSONDecodeError, KeyError):
+        owner, name = gh_api.resolve_repo(repo)
+        data = gh_api.cached_json(
+            f"{owner}/{name}:milestones",
+            ttl_s=60,
+            fetch=lambda: gh_api.get_paginated(f"/repos/{owner}/{name}/milestones"),
+        )
+    except gh_api.GitHubError as exc:
+        print(f"  [warn] Could not fetch milestones: {exc}")
         return {}
+    return {m["title"]: m["number"] for m in data}
+
+
+def _milestone_payload(title: str, description: str, due_date: str | None) -> dict:
+    payload = {"title": title, "description": description}
+    if due_date:
+        # GitHub expects ISO 8601 with time: YYYY-MM-DDTHH:MM:SSZ
+        payload["due_on"] = f"{due_date}T23:59:59Z"
+    return payload
 
 
 def create_milestone(
@@ -54,24 +56,11 @@ def create_milestone(
     due_date: str | None,
     repo: str | None,
 ) -> None:
-    cmd = ["gh", "api", "--method", "POST"]
-
-    if repo:
-        owner, name = repo.split("/", 1)
-        cmd += [f"repos/{owner}/{name}/milestones"]
-    else:
-        cmd += ["repos/{owner}/{repo}/milestones"]
-
-    cmd += [
-        "--field", f"title={title}",
-        "--field", f"description={description}",
-    ]
-    if due_date:
-        # GitHub expects ISO 8601 with time: YYYY-MM-DDTHH:MM:SSZ
-        due_on = f"{due_date}T23:59:59Z"
-        cmd += ["--field", f"due_on={due_on}"]
-
-    run(cmd)
+    owner, name = gh_api.resolve_repo(repo)
+    gh_api.post(
+        f"/repos/{owner}/{name}/milestones",
+        _milestone_payload(title, description, due_date),
+    )
 
 
 def update_milestone(
@@ -81,48 +70,57 @@ def update_milestone(
     due_date: str | None,
     repo: str | None,
 ) -> None:
-    cmd = ["gh", "api", "--method", "PATCH"]
-
-    if repo:
-        owner, name = repo.split("/", 1)
-        cmd += [f"repos/{owner}/{name}/milestones/{number}"]
-    else:
-        cmd += [f"repos/{{owner}}/{{repo}}/milestones/{number}"]
-
-    cmd += [
-        "--field", f"title={title}",
-        "--field", f"description={description}",
-    ]
-    if due_date:
-        due_on = f"{due_date}T23:59:59Z"
-        cmd += ["--field", f"due_on={due_on}"]
-
-    run(cmd)
-
-
-def main(path: str = "milestones.yaml", repo: str | None = None) -> None:
-    items: list[dict] = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    owner, name = gh_api.resolve_repo(repo)
+    gh_api.patch(
+        f"/repos/{owner}/{name}/milestones/{number}",
+        _milestone_payload(title, description, due_date),
+    )
+
+
+def main(
+    path: str = "milestones.yaml",
+    repo: str | None = None,
+    workers: int = 8,
+    no_cache: bool = False,
+) -> None:
+    if no_cache:
+        gh_api.disable_cache()
+    with open(path, "rb") as handle:
+        items: list[dict] = yaml.load(handle, Loader=_YamlLoader)
     existing = get_existing_milestones(repo)
 
     created = updated = errors = 0
 
-    for item in items:
-        title: str = item["title"]
-        description: str = item.get("description", "").strip()
-        due_date: str | None = item.get("due_date")
+    # Milestone writes are network-bound, so fan the API calls out over threads.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for item in items:
+            title: str = item["title"]
+            description: str = item.get("description", "").strip()
+            due_date: str | None = item.get("due_date")
 
-        try:
             if title in existing:
-                print(f"[update] {title}")
-                update_milestone(existing[title], title, description, due_date, repo)
+                future = executor.submit(
+                    update_milestone, existing[title], title, description, due_date, repo
+                )
+                futures[future] = (title, "update")
+            else:
+                future = executor.submit(create_milestone, title, description, due_date, repo)
+                futures[future] = (title, "create")
+
+        for future in as_completed(futures):
+            title, action = futures[future]
+            try:
+                future.result()
+            except gh_api.GitHubError as exc:
+                print(f"  [error] Failed for milestone '{title}': {exc}", file=sys.stderr)
+                errors += 1
+                continue
+            print(f"[{action}] {title}")
+            if action == "update":
                 updated += 1
             else:
-                print(f"[create] {title}")
-                create_milestone(title, description, due_date, repo)
                 created += 1
-        except subprocess.CalledProcessError as exc:
-            print(f"  [error] Failed for milestone '{title}': {exc}", file=sys.stderr)
-            errors += 1
 
     print(f"\nDone. created={created}  updated={updated}  errors={errors}")
 
@@ -133,5 +131,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Import milestones from YAML to GitHub.")
     parser.add_argument("--file", default="milestones.yaml", help="Path to milestones YAML file")
     parser.add_argument("--repo", default=None, help="GitHub repo in owner/name format")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent milestone submissions")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the local GitHub response cache"
+    )
     args = parser.parse_args()
-    main(path=args.file, repo=args.repo)
+    main(path=args.file, repo=args.repo, workers=args.workers, no_cache=args.no_cache)
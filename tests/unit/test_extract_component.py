@@ -59,6 +59,21 @@ def test_extract_component_supports_png_via_ocr(component: KreuzbergExtractCompo
     assert result["pages"][0]["metadata"]["page_number"] == 1
 
 
+def test_extract_component_sniffs_mime_from_magic_bytes(
+    component: KreuzbergExtractComponent,
+) -> None:
+    payload = {
+        "bytes": b"\x89PNG\r\n\x1a\n",
+        "filename": "scan-without-mime",
+        "source_id": "src-sniffed",
+    }
+
+    result = component.build(document_source=payload, ocr_mode="auto")
+
+    assert result["extracted_doc"]["metadata"]["mime"] == "image/png"
+    assert result["extracted_doc"]["metadata"]["ocr_used"] is True
+
+
 def test_extract_component_rejects_unsupported_format(component: KreuzbergExtractComponent) -> None:
     payload = {
         "bytes": b"{\"a\":1}",
@@ -93,6 +108,15 @@ def test_extract_component_defines_langflow_ports() -> None:
     assert "extracted_doc" in output_names
 
 
+def test_extract_component_port_name_sets_are_cached() -> None:
+    first = KreuzbergExtractComponent.input_names()
+    second = KreuzbergExtractComponent.input_names()
+
+    assert first is second
+    assert "document_source" in first
+    assert "run_report" in KreuzbergExtractComponent.output_names()
+
+
 def test_extract_component_output_methods_return_data_wrapper(
     component: KreuzbergExtractComponent,
 ) -> None:
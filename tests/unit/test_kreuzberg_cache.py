@@ -59,6 +59,12 @@ def test_parallel_map_process_mode_preserves_order() -> None:
     assert result == [4, 8, 12]
 
 
+def test_parallel_map_async_mode_preserves_order() -> None:
+    result = parallel_map(multiply_by_two, [7, 3, 9], max_workers=2, mode="async")
+
+    assert result == [14, 6, 18]
+
+
 def test_parallel_map_invalid_arguments() -> None:
     with pytest.raises(ValueError, match="max_workers"):
         parallel_map(multiply_by_two, [1], max_workers=0)
@@ -0,0 +1,24 @@
+"""Tests for bulk file-loading helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from components.kreuzberg.kreuzberg_io import BatchFileLoader
+
+
+def test_batch_file_loader_preserves_order(tmp_path: Path) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"doc-{index}.txt"
+        path.write_bytes(f"content {index}".encode("utf-8"))
+        paths.append(path)
+
+    loader = BatchFileLoader()
+    payloads = loader.load(paths)
+
+    assert payloads == [b"content 0", b"content 1", b"content 2"]
+
+
+def test_batch_file_loader_handles_empty_batch() -> None:
+    assert BatchFileLoader().load([]) == []